@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import io
+import itertools
 import json
 import os
+import random
 import re
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import httpx
+import orjson
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
@@ -35,6 +44,19 @@ OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 # Optional: delete intermediate Google Docs after export (recommended in CI)
 DELETE_INTERMEDIATE_DOCS = os.getenv("DELETE_INTERMEDIATE_DOCS", "true").lower() in ("1", "true", "yes")
 
+# Optional: render PDFs locally (python-docx + LibreOffice) from one .docx export
+# of the template, instead of a Google Doc copy/update/export per row
+LOCAL_RENDER = os.getenv("LOCAL_RENDER", "false").lower() in ("1", "true", "yes")
+SOFFICE_BIN = os.getenv("SOFFICE_BIN", "soffice").strip()
+
+# Rows processed in parallel (keep low: Drive allows ~10 requests/sec per user)
+MAX_WORKERS = max(1, int(os.getenv("MAX_WORKERS", "8")))
+
+# Retries (exponential backoff) for Google calls failing with 429 / 5xx
+GOOGLE_NUM_RETRIES = int(os.getenv("GOOGLE_NUM_RETRIES", "5"))
+
+EXPORT_CHUNK_SIZE = 1 << 20
+
 
 # =========================
 # UTILS
@@ -43,17 +65,56 @@ def die(msg: str) -> None:
     raise SystemExit(f"ERROR: {msg}")
 
 
+_SLUG_BAD = re.compile(r"[^\w\- ]+", re.UNICODE)
+_SLUG_WS = re.compile(r"\s+")
+# ASCII equivalent of _SLUG_BAD: drop everything but [A-Za-z0-9_\- ]
+_SLUG_ASCII_DROP = str.maketrans("", "", "".join(
+    c for c in map(chr, range(128)) if not (c.isalnum() or c in "_- ")
+))
+
+
 def slugify(s: str) -> str:
     s = (s or "").strip()
-    s = re.sub(r"[^\w\- ]+", "", s, flags=re.UNICODE)
-    s = re.sub(r"\s+", "_", s)
+    s = s.translate(_SLUG_ASCII_DROP) if s.isascii() else _SLUG_BAD.sub("", s)
+    s = _SLUG_WS.sub("_", s)
     return s[:120] if s else "document"
 
 
+PLACEHOLDER_RE = re.compile(r"\{\{[^{}]+\}\}")
+
+
 def rich_plain_text(rich: List[Dict[str, Any]]) -> str:
     return "".join(x.get("plain_text", "") for x in (rich or []))
 
 
+def _formula_to_str(v: Optional[Dict[str, Any]]) -> str:
+    ft = (v or {}).get("type")
+    return "" if not ft else str((v or {}).get(ft) or "")
+
+
+def _name_or_empty(v: Optional[Dict[str, Any]]) -> str:
+    return v["name"] if v else ""
+
+
+# Notion property type -> formatter of that property's value
+_PROP_HANDLERS = {
+    "title": rich_plain_text,
+    "rich_text": rich_plain_text,
+    "number": lambda v: "" if v is None else str(v),
+    "checkbox": lambda v: "TRUE" if v else "FALSE",
+    "select": _name_or_empty,
+    "multi_select": lambda v: ", ".join(x["name"] for x in (v or [])),
+    "date": lambda v: v.get("start", "") if v else "",
+    "email": lambda v: v or "",
+    "phone_number": lambda v: v or "",
+    "url": lambda v: v or "",
+    "people": lambda v: ", ".join((p.get("name") or "") for p in (v or [])),
+    "relation": lambda v: ", ".join(r.get("id", "") for r in (v or [])),
+    "formula": _formula_to_str,
+    "status": _name_or_empty,
+}
+
+
 def notion_prop_to_str(prop: Dict[str, Any]) -> str:
     """Convert a Notion property object to a printable string (common types)."""
     t = prop.get("type")
@@ -61,32 +122,9 @@ def notion_prop_to_str(prop: Dict[str, Any]) -> str:
         return ""
 
     v = prop.get(t)
-
-    if t == "title":
-        return rich_plain_text(v)
-    if t == "rich_text":
-        return rich_plain_text(v)
-    if t == "number":
-        return "" if v is None else str(v)
-    if t == "checkbox":
-        return "TRUE" if v else "FALSE"
-    if t == "select":
-        return v["name"] if v else ""
-    if t == "multi_select":
-        return ", ".join(x["name"] for x in (v or []))
-    if t == "date":
-        return v.get("start", "") if v else ""
-    if t in ("email", "phone_number", "url"):
-        return v or ""
-    if t == "people":
-        return ", ".join((p.get("name") or "") for p in (v or []))
-    if t == "relation":
-        return ", ".join(r.get("id", "") for r in (v or []))
-    if t == "formula":
-        ft = (v or {}).get("type")
-        return "" if not ft else str((v or {}).get(ft) or "")
-    if t == "status":
-        return v["name"] if v else ""
+    handler = _PROP_HANDLERS.get(t)
+    if handler is not None:
+        return handler(v)
 
     return str(v) if v is not None else ""
 
@@ -94,44 +132,70 @@ def notion_prop_to_str(prop: Dict[str, Any]) -> str:
 # =========================
 # NOTION (raw HTTP, robust in CI)
 # =========================
-def fetch_all_notion_rows(database_id: str) -> List[Dict[str, Any]]:
-    if not NOTION_TOKEN:
-        die("NOTION_TOKEN is missing (set GitHub secret NOTION_TOKEN).")
-    if not database_id:
-        die("NOTION_DATABASE_ID is missing (set GitHub secret NOTION_DATABASE_ID).")
+_notion_client: Optional[httpx.Client] = None
+
+# Body of the first (cursor-less) query, serialized once
+_NOTION_FIRST_QUERY = orjson.dumps({"page_size": 100})
+
+
+def notion_client() -> httpx.Client:
+    """One HTTP/2 client per run: keeps the TLS session and auth headers warm."""
+    global _notion_client
+    if _notion_client is None:
+        _notion_client = httpx.Client(
+            http2=True,
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            headers={
+                "Authorization": f"Bearer {NOTION_TOKEN}",
+                "Notion-Version": NOTION_VERSION,
+                "Content-Type": "application/json",
+            },
+        )
+    return _notion_client
+
+
+def _notion_query_pages(client: httpx.Client, database_id: str) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yield the results of each query page in order.
+    Lazy: the request for the next page (which needs `next_cursor` from the
+    current body) is only sent when the caller asks for it.
+    """
+    url = f"https://api.notion.com/v1/databases/{database_id}/query"
+    body = _NOTION_FIRST_QUERY
 
-    headers = {
-        "Authorization": f"Bearer {NOTION_TOKEN}",
-        "Notion-Version": NOTION_VERSION,
-        "Content-Type": "application/json",
-    }
+    while True:
+        r = client.post(url, content=body)
 
-    results: List[Dict[str, Any]] = []
-    cursor: Optional[str] = None
+        if r.status_code >= 400:
+            die(f"Notion API error {r.status_code}: {r.text}")
 
-    with httpx.Client(timeout=60) as client:
-        while True:
-            payload: Dict[str, Any] = {"page_size": 100}
-            if cursor:
-                payload["start_cursor"] = cursor
+        data = orjson.loads(r.content)
+        yield data.get("results", [])
 
-            r = client.post(
-                f"https://api.notion.com/v1/databases/{database_id}/query",
-                headers=headers,
-                json=payload,
-            )
+        if not data.get("has_more"):
+            return
+        cursor = data.get("next_cursor")
+        body = orjson.dumps({"page_size": 100, "start_cursor": cursor}) if cursor else _NOTION_FIRST_QUERY
 
-            if r.status_code >= 400:
-                die(f"Notion API error {r.status_code}: {r.text}")
 
-            data = r.json()
-            results.extend(data.get("results", []))
+def iter_notion_rows(database_id: str) -> Iterator[Dict[str, Any]]:
+    """Stream database rows page by page (config is validated eagerly)."""
+    if not NOTION_TOKEN:
+        die("NOTION_TOKEN is missing (set GitHub secret NOTION_TOKEN).")
+    if not database_id:
+        die("NOTION_DATABASE_ID is missing (set GitHub secret NOTION_DATABASE_ID).")
+
+    return (
+        row
+        for page_results in _notion_query_pages(notion_client(), database_id)
+        for row in page_results
+    )
 
-            if not data.get("has_more"):
-                break
-            cursor = data.get("next_cursor")
 
-    return results
+# Notion property name -> "{{name}}"; property names are the same on every row.
+# Only touched from the main thread (rows are mapped before being submitted).
+_PH_KEY_CACHE: Dict[str, str] = {}
 
 
 def row_to_placeholder_map(page: Dict[str, Any]) -> Dict[str, str]:
@@ -142,14 +206,15 @@ def row_to_placeholder_map(page: Dict[str, Any]) -> Dict[str, str]:
     props = page.get("properties", {})
     repl: Dict[str, str] = {}
     for col_name, prop_obj in props.items():
-        repl[f"{{{{{col_name}}}}}"] = notion_prop_to_str(prop_obj)
+        ph = _PH_KEY_CACHE.get(col_name) or _PH_KEY_CACHE.setdefault(col_name, f"{{{{{col_name}}}}}")
+        repl[ph] = notion_prop_to_str(prop_obj)
     return repl
 
 
 # =========================
 # GOOGLE (OAuth refresh token from secret)
 # =========================
-def google_clients_from_token_json():
+def google_credentials_from_token_json() -> Credentials:
     if not GOOGLE_TOKEN_JSON:
         die("GOOGLE_TOKEN_JSON missing (set GitHub secret GOOGLE_TOKEN_JSON).")
 
@@ -167,23 +232,177 @@ def google_clients_from_token_json():
         else:
             die("Google credentials invalid and cannot refresh. Re-generate google_token.json with refresh_token.")
 
-    docs = build("docs", "v1", credentials=creds)
-    drive = build("drive", "v3", credentials=creds)
+    return creds
+
+
+def google_clients(creds: Credentials):
+    # Discovery documents bundled with google-api-python-client (the 2.x default;
+    # requirements.txt pins a release whose docs.v1 has includeTabsContent):
+    # no network fetch on cold start
+    docs = build("docs", "v1", credentials=creds, static_discovery=True, cache_discovery=False)
+    drive = build("drive", "v3", credentials=creds, static_discovery=True, cache_discovery=False)
     return docs, drive
 
 
-def copy_template_doc(drive, template_doc_id: str, new_title: str) -> str:
+# Per-row calls (copy, batchUpdate, export) go over raw HTTP: one httpx client
+# is thread-safe and shared by all workers, unlike googleapiclient services
+# (one httplib2.Http each), and skips their request-building overhead.
+_RATE_LIMIT_REASONS = {"userRateLimitExceeded", "rateLimitExceeded"}
+
+
+def _should_retry(r: httpx.Response) -> bool:
+    """Mirrors googleapiclient.http._should_retry_response."""
+    if r.status_code >= 500 or r.status_code == 429:
+        return True
+    if r.status_code != 403:
+        return False
+
+    # Drive reports per-user rate limits (e.g. too many copies) as 403
+    try:
+        reason = orjson.loads(r.content)["error"]["errors"][0]["reason"]
+    except (ValueError, KeyError, IndexError, TypeError):
+        return False
+    return reason in _RATE_LIMIT_REASONS
+
+
+class _GoogleAuth(httpx.Auth):
+    """Bearer token from the OAuth credentials, refreshed once on 401."""
+
+    def __init__(self, creds: Credentials) -> None:
+        self._creds = creds
+        self._lock = threading.Lock()
+
+    def auth_flow(self, request: httpx.Request):
+        token = self._creds.token
+        request.headers["Authorization"] = f"Bearer {token}"
+        response = yield request
+
+        if response.status_code == 401:
+            with self._lock:
+                if self._creds.token == token:
+                    self._creds.refresh(Request())
+            request.headers["Authorization"] = f"Bearer {self._creds.token}"
+            yield request
+
+
+def google_http_client(creds: Credentials) -> httpx.Client:
+    return httpx.Client(
+        http2=True,
+        auth=_GoogleAuth(creds),
+        timeout=httpx.Timeout(120.0, connect=10.0),
+        limits=httpx.Limits(max_keepalive_connections=MAX_WORKERS, max_connections=2 * MAX_WORKERS),
+        headers={"Content-Type": "application/json"},
+    )
+
+
+def _backoff(attempt: int) -> None:
+    time.sleep(2 ** (attempt - 1) + random.random())
+
+
+def _google_send(client: httpx.Client, method: str, url: str, *, stream: bool = False, **kwargs) -> httpx.Response:
+    # Same policy as googleapiclient's num_retries: exponential backoff on
+    # 429 / 5xx / rate-limit 403s and on network errors (timeouts, resets,
+    # HTTP/2 GOAWAY)
+    request = client.build_request(method, url, **kwargs)
+    error = ""
+    for attempt in range(GOOGLE_NUM_RETRIES + 1):
+        if attempt:
+            _backoff(attempt)
+
+        try:
+            r = client.send(request, stream=stream)
+        except httpx.TransportError as e:
+            error = f"{type(e).__name__}: {e}"
+            continue
+
+        if r.status_code < 400:
+            return r
+
+        r.read()
+        r.close()
+        error = f"{r.status_code}: {r.text}"
+        if not _should_retry(r):
+            break
+
+    die(f"Google API error ({method} {url}): {error}")
+
+
+def copy_template_doc(client: httpx.Client, template_doc_id: str, new_title: str) -> str:
     if not template_doc_id:
         die("GOOGLE_TEMPLATE_DOC_ID missing (set GitHub secret GOOGLE_TEMPLATE_DOC_ID).")
 
-    copied = drive.files().copy(
-        fileId=template_doc_id,
-        body={"name": new_title, "mimeType": "application/vnd.google-apps.document"},
-    ).execute()
-    return copied["id"]
+    r = _google_send(
+        client,
+        "POST",
+        f"https://www.googleapis.com/drive/v3/files/{template_doc_id}/copy",
+        params={"fields": "id"},
+        content=orjson.dumps({"name": new_title, "mimeType": "application/vnd.google-apps.document"}),
+    )
+    return orjson.loads(r.content)["id"]
+
+
+def _structural_text(content: List[Dict[str, Any]]) -> str:
+    parts: List[str] = []
+    for el in content or []:
+        if "paragraph" in el:
+            parts.extend(
+                (pe.get("textRun") or {}).get("content", "")
+                for pe in el["paragraph"].get("elements", [])
+            )
+        elif "table" in el:
+            for row in el["table"].get("tableRows", []):
+                for cell in row.get("tableCells", []):
+                    parts.append(_structural_text(cell.get("content")))
+        elif "tableOfContents" in el:
+            parts.append(_structural_text(el["tableOfContents"].get("content")))
+    return "".join(parts)
+
+
+def _iter_document_tabs(tabs: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    for tab in tabs:
+        yield tab.get("documentTab", {})
+        yield from _iter_document_tabs(tab.get("childTabs", []))
+
+
+def template_placeholders(docs, template_doc_id: str) -> Set[str]:
+    """All {{...}} tokens in the template (every tab: body, headers, footers, footnotes)."""
+    if not template_doc_id:
+        die("GOOGLE_TEMPLATE_DOC_ID missing (set GitHub secret GOOGLE_TEMPLATE_DOC_ID).")
 
+    # replaceAllText applies to every tab, so read them all (not just the first)
+    doc = docs.documents().get(
+        documentId=template_doc_id,
+        includeTabsContent=True,
+        fields="tabs",
+    ).execute(num_retries=GOOGLE_NUM_RETRIES)
+
+    segments = []
+    for doc_tab in _iter_document_tabs(doc.get("tabs", [])):
+        segments.append(doc_tab.get("body", {}))
+        for key in ("headers", "footers", "footnotes"):
+            segments.extend((doc_tab.get(key) or {}).values())
+
+    text = "".join(_structural_text(seg.get("content")) for seg in segments)
+    return set(PLACEHOLDER_RE.findall(text))
+
+
+def replace_placeholders(
+    client: httpx.Client,
+    document_id: str,
+    repl: Dict[str, str],
+    placeholders: Optional[Set[str]] = None,
+) -> None:
+    # Only send replacements for tokens the template actually contains, and
+    # skip no-ops (a value identical to its placeholder). Keys of `repl` are
+    # unique, so every remaining (placeholder, value) pair is sent once.
+    repl = {
+        ph: value
+        for ph, value in repl.items()
+        if value != ph and (placeholders is None or ph in placeholders)
+    }
+    if not repl:
+        return
 
-def replace_placeholders(docs, document_id: str, repl: Dict[str, str]) -> None:
     # One batchUpdate call with many replaceAllText requests
     requests = [
         {
@@ -195,57 +414,357 @@ def replace_placeholders(docs, document_id: str, repl: Dict[str, str]) -> None:
         for placeholder, value in repl.items()
     ]
 
-    docs.documents().batchUpdate(
-        documentId=document_id,
-        body={"requests": requests},
-    ).execute()
+    _google_send(
+        client,
+        "POST",
+        f"https://docs.googleapis.com/v1/documents/{document_id}:batchUpdate",
+        content=orjson.dumps({"requests": requests}),
+    )
+
+
+def delete_docs(drive, document_ids: List[str]) -> None:
+    # Batch requests carry up to 100 sub-requests per HTTP round-trip
+    def on_deleted(request_id, response, exception) -> None:
+        if exception is not None:
+            print(f"WARNING: could not delete intermediate doc {request_id}: {exception}")
+
+    for start in range(0, len(document_ids), 100):
+        chunk = document_ids[start:start + 100]
+        batch = drive.new_batch_http_request(callback=on_deleted)
+        for doc_id in chunk:
+            batch.add(drive.files().delete(fileId=doc_id), request_id=doc_id)
+        # Best-effort cleanup: never mask a row failure or fail a good run
+        try:
+            batch.execute()
+        except Exception as e:
+            print(f"WARNING: could not delete {len(chunk)} intermediate docs ({', '.join(chunk)}): {e}")
+
+
+def export_pdf(client: httpx.Client, document_id: str, out_path: Path) -> None:
+    # Stream to disk in 1 MiB chunks instead of holding the whole PDF in memory.
+    # The body goes to a temp file that replaces out_path only once complete; a
+    # body cut off mid-stream is downloaded again (exports can't be resumed).
+    tmp_path = out_path.with_name(out_path.name + ".part")
+    error = ""
+    try:
+        for attempt in range(GOOGLE_NUM_RETRIES + 1):
+            if attempt:
+                _backoff(attempt)
+
+            r = _google_send(
+                client,
+                "GET",
+                f"https://www.googleapis.com/drive/v3/files/{document_id}/export",
+                params={"mimeType": "application/pdf"},
+                stream=True,
+            )
+            try:
+                with open(tmp_path, "wb", buffering=EXPORT_CHUNK_SIZE) as fh:
+                    for chunk in r.iter_bytes(EXPORT_CHUNK_SIZE):
+                        fh.write(chunk)
+            except httpx.TransportError as e:
+                error = f"{type(e).__name__}: {e}"
+                continue
+            finally:
+                r.close()
 
+            os.replace(tmp_path, out_path)
+            return
 
-def export_pdf(drive, document_id: str, out_path: Path) -> None:
-    req = drive.files().export_media(fileId=document_id, mimeType="application/pdf")
-    data = req.execute()
-    out_path.write_bytes(data)
+        die(f"PDF export of {document_id} kept failing mid-download: {error}")
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+# =========================
+# LOCAL RENDERING (python-docx + LibreOffice)
+# =========================
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+def download_template_docx(drive, template_doc_id: str) -> bytes:
+    if not template_doc_id:
+        die("GOOGLE_TEMPLATE_DOC_ID missing (set GitHub secret GOOGLE_TEMPLATE_DOC_ID).")
+
+    req = drive.files().export_media(fileId=template_doc_id, mimeType=DOCX_MIME)
+    return req.execute(num_retries=GOOGLE_NUM_RETRIES)
+
+
+def _iter_docx_paragraphs(container):
+    """Paragraphs of a document/cell/header, including those nested in tables."""
+    yield from container.paragraphs
+    for table in container.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                yield from _iter_docx_paragraphs(cell)
+
+
+def _paragraph_runs(para):
+    """
+    Text runs of a paragraph in document order. Unlike `para.runs`, this also
+    includes runs inside hyperlinks and tracked insertions (w:hyperlink,
+    w:ins), which the Google path replaces too. Runs nested deeper (e.g. in
+    field codes or content controls) are still not visited.
+    """
+    from docx.text.run import Run
+
+    return [Run(r, para) for r in para._p.xpath("./w:r | ./w:hyperlink/w:r | ./w:ins/w:r")]
+
+
+def _iter_all_docx_paragraphs(doc):
+    yield from _iter_docx_paragraphs(doc)
+    for section in doc.sections:
+        parts = (
+            section.header, section.footer,
+            section.first_page_header, section.first_page_footer,
+            section.even_page_header, section.even_page_footer,
+        )
+        for part in parts:
+            # A linked part has no content of its own (and python-docx would
+            # add an empty definition on access)
+            if not part.is_linked_to_previous:
+                yield from _iter_docx_paragraphs(part)
+
+
+def _load_docx(template_bytes: bytes):
+    try:
+        from docx import Document
+    except ImportError:
+        die("LOCAL_RENDER needs python-docx (pip install python-docx).")
+
+    return Document(io.BytesIO(template_bytes))
+
+
+def _escape_format(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def _compile_paragraph(texts: List[str], fields: Dict[str, str]) -> Optional[List[Tuple[int, str]]]:
+    """
+    Map the run texts of one paragraph to (run index, str.format template)
+    edits, registering each {{placeholder}} -> field name (f0, f1, ...) in
+    `fields`. Only runs a placeholder overlaps are edited; a placeholder split
+    across runs is rendered into the run where it starts and removed from the
+    others. Returns None when the paragraph has no placeholders.
+    """
+    full = "".join(texts)
+    matches = list(PLACEHOLDER_RE.finditer(full))
+    if not matches:
+        return None
+
+    edits: List[Tuple[int, str]] = []
+    start = 0
+    for k, text in enumerate(texts):
+        end = start + len(text)
+        overlapping = [m for m in matches if m.start() < end and m.end() > start]
+        if overlapping:
+            out: List[str] = []
+            pos = start
+            for m in overlapping:
+                if m.start() >= start:
+                    out.append(_escape_format(full[pos:m.start()]))
+                    field = fields.setdefault(m.group(0), f"f{len(fields)}")
+                    out.append(f"{{{field}}}")
+                pos = min(m.end(), end)
+            out.append(_escape_format(full[pos:end]))
+            edits.append((k, "".join(out)))
+        start = end
+    return edits
+
+
+def compile_docx_template(template_bytes: bytes) -> Tuple[Dict[str, str], List[Optional[List[Tuple[int, str]]]]]:
+    """
+    Parse the template once. Returns ({{placeholder}} -> format field name,
+    and per paragraph (in document order) its run edits, or None when the
+    paragraph has no placeholders.
+    """
+    fields: Dict[str, str] = {}
+    formats: List[Optional[List[Tuple[int, str]]]] = []
+    for para in _iter_all_docx_paragraphs(_load_docx(template_bytes)):
+        formats.append(_compile_paragraph([r.text for r in _paragraph_runs(para)], fields))
+    return fields, formats
+
+
+def render_docx(
+    template_bytes: bytes,
+    compiled: Tuple[Dict[str, str], List[Optional[List[Tuple[int, str]]]]],
+    repl: Dict[str, str],
+    out_path: Path,
+) -> None:
+    fields, formats = compiled
+    # Unknown placeholders render as themselves
+    values = {field: repl.get(ph, ph) for ph, field in fields.items()}
+
+    doc = _load_docx(template_bytes)
+    for para, edits in zip(_iter_all_docx_paragraphs(doc), formats):
+        if edits is None:
+            continue
+
+        # Setting run.text drops the run's other children (e.g. images), so
+        # only runs that carry placeholder text are touched.
+        runs = _paragraph_runs(para)
+        for k, fmt in edits:
+            runs[k].text = fmt.format_map(values)
+
+    doc.save(str(out_path))
+
+
+def convert_docx_to_pdf(docx_paths: List[Path], out_dir: Path) -> List[Path]:
+    pdf_paths = [out_dir / f"{p.stem}.pdf" for p in docx_paths]
+    # soffice exits 0 even when a file fails to convert, so success is judged by
+    # the outputs: drop leftovers from earlier runs first
+    for pdf_path in pdf_paths:
+        pdf_path.unlink(missing_ok=True)
+
+    # One LibreOffice process for the whole batch (startup dominates per-file cost)
+    cmd = [SOFFICE_BIN, "--headless", "--convert-to", "pdf", "--outdir", str(out_dir), *map(str, docx_paths)]
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+    except FileNotFoundError:
+        die(f"LOCAL_RENDER needs LibreOffice ({SOFFICE_BIN!r} not found; set SOFFICE_BIN).")
+
+    if proc.returncode != 0:
+        die(f"LibreOffice conversion failed ({proc.returncode}): {proc.stderr}")
+
+    missing = [p.name for p in pdf_paths if not p.exists()]
+    if missing:
+        die(f"LibreOffice did not produce {', '.join(missing)}: {proc.stderr}")
+
+    return pdf_paths
 
 
 # =========================
 # MAIN
 # =========================
-def main() -> None:
-    docs, drive = google_clients_from_token_json()
+# Filename based on likely columns (as placeholder keys of the row map)
+PREFERRED_NAME_PLACEHOLDERS = [f"{{{{{col}}}}}" for col in ("Invoice #", "Invoice", "Name", "Title", "ID")]
 
-    rows = fetch_all_notion_rows(NOTION_DATABASE_ID)
-    if not rows:
-        die("No rows found in Notion database.")
 
-    print(f"Found {len(rows)} rows. Output: {OUTPUT_DIR.resolve()}")
+def pdf_basename(repl: Dict[str, str], i: int) -> str:
+    base_name = next(
+        (repl[ph].strip() for ph in PREFERRED_NAME_PLACEHOLDERS if repl.get(ph, "").strip()),
+        None,
+    )
+    return slugify(base_name or f"row_{i}")
+
+
+def unique_name(name: str, used: Set[str]) -> str:
+    """`name`, or `name_2`, `name_3`, ... if already taken in this run."""
+    candidate, n = name, 1
+    while candidate in used:
+        n += 1
+        candidate = f"{name}_{n}"
+    used.add(candidate)
+    return candidate
+
 
-    for i, page in enumerate(rows, start=1):
-        repl = row_to_placeholder_map(page)
+def process_row(
+    repl: Dict[str, str],
+    safe_name: str,
+    client: httpx.Client,
+    placeholders: Set[str],
+    created: List[str],
+) -> Path:
+    new_title = f"PDF_{safe_name}"
 
-        # filename based on likely columns
-        preferred_cols = ["Invoice #", "Invoice", "Name", "Title", "ID"]
-        base_name = None
-        for col in preferred_cols:
-            ph = f"{{{{{col}}}}}"
-            if repl.get(ph, "").strip():
-                base_name = repl[ph].strip()
-                break
-        if not base_name:
-            base_name = f"row_{i}"
+    new_doc_id = copy_template_doc(client, GOOGLE_TEMPLATE_DOC_ID, new_title)
+    # Recorded before anything else can fail, so the doc is cleaned up either way
+    created.append(new_doc_id)
+    replace_placeholders(client, new_doc_id, repl, placeholders)
 
-        safe_name = slugify(base_name)
-        new_title = f"PDF_{safe_name}"
+    pdf_path = OUTPUT_DIR / f"{safe_name}.pdf"
+    export_pdf(client, new_doc_id, pdf_path)
 
-        new_doc_id = copy_template_doc(drive, GOOGLE_TEMPLATE_DOC_ID, new_title)
-        replace_placeholders(docs, new_doc_id, repl)
+    return pdf_path
 
-        pdf_path = OUTPUT_DIR / f"{safe_name}.pdf"
-        export_pdf(drive, new_doc_id, pdf_path)
 
-        if DELETE_INTERMEDIATE_DOCS:
-            drive.files().delete(fileId=new_doc_id).execute()
+def render_rows_locally(rows: Iterable[Dict[str, Any]], template_bytes: bytes) -> None:
+    compiled = compile_docx_template(template_bytes)
 
-        print(f"[{i}/{len(rows)}] Saved: {pdf_path.name}")
+    used_names: Set[str] = set()
+    with tempfile.TemporaryDirectory() as tmp:
+        docx_paths = []
+        for i, page in enumerate(rows, start=1):
+            repl = row_to_placeholder_map(page)
+            docx_path = Path(tmp) / f"{unique_name(pdf_basename(repl, i), used_names)}.docx"
+            render_docx(template_bytes, compiled, repl, docx_path)
+            docx_paths.append(docx_path)
+
+        pdf_paths = convert_docx_to_pdf(docx_paths, OUTPUT_DIR)
+
+    for i, pdf_path in enumerate(pdf_paths, start=1):
+        print(f"[{i}/{len(pdf_paths)}] Saved: {pdf_path.name}")
+
+
+def google_setup() -> Tuple[Credentials, Any, Set[str]]:
+    creds = google_credentials_from_token_json()
+    docs, drive = google_clients(creds)
+    return creds, drive, template_placeholders(docs, GOOGLE_TEMPLATE_DOC_ID)
+
+
+def local_setup() -> bytes:
+    _, drive = google_clients(google_credentials_from_token_json())
+    return download_template_docx(drive, GOOGLE_TEMPLATE_DOC_ID)
+
+
+def main() -> None:
+    rows = iter_notion_rows(NOTION_DATABASE_ID)
+
+    print(f"Output: {OUTPUT_DIR.resolve()}")
+
+    # Google auth refresh + template fetch run while the first Notion page loads
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        setup = ex.submit(local_setup if LOCAL_RENDER else google_setup)
+        first_row = next(rows, None)
+        prepared = setup.result()
+
+    if first_row is None:
+        die("No rows found in Notion database.")
+    rows = itertools.chain([first_row], rows)
+
+    if LOCAL_RENDER:
+        render_rows_locally(rows, prepared)
+        print("Done.")
+        return
+
+    creds, drive, placeholders = prepared
+    created: List[str] = []
+    saved = 0
+
+    def collect(finished: Iterable[Future]) -> None:
+        nonlocal saved
+        for fut in finished:
+            pdf_path = fut.result()
+            saved += 1
+            print(f"[{saved}] Saved: {pdf_path.name}")
+
+    # Rows are submitted while Notion pages are still streaming in; in-flight
+    # work is capped so memory stays O(page + workers), not O(database).
+    # Names are made unique here, before submitting, so that concurrent
+    # workers never write to the same PDF path.
+    used_names: Set[str] = set()
+    pending: Set[Future] = set()
+    try:
+        with google_http_client(creds) as client, ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+            try:
+                for i, page in enumerate(rows, start=1):
+                    if len(pending) >= 2 * MAX_WORKERS:
+                        finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        collect(finished)
+                    repl = row_to_placeholder_map(page)
+                    safe_name = unique_name(pdf_basename(repl, i), used_names)
+                    pending.add(ex.submit(process_row, repl, safe_name, client, placeholders, created))
+                collect(as_completed(pending))
+            except BaseException:
+                # Don't start queued rows; running ones finish on executor exit
+                for fut in pending:
+                    fut.cancel()
+                raise
+    finally:
+        # Runs on failure too: docs of finished and in-flight rows are not left in Drive
+        if DELETE_INTERMEDIATE_DOCS and created:
+            delete_docs(drive, created)
+            print(f"Deleted {len(created)} intermediate docs.")
 
     print("Done.")
 